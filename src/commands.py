@@ -45,42 +45,66 @@ class WildfireGame:
         """
         self.db_path = db_path
         self.active_fires = {}  # In-memory cache, though primary state is in DB
+        self._db = None  # Shared connection, opened by init_database()
         
     async def init_database(self):
         """
         Initializes the SQLite database and creates necessary tables if they don't exist.
 
-        This method sets up the `fires` and `responders` tables required for game operation.
-        It should be called once when the game system starts.
-        """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS fires (
-                    id TEXT PRIMARY KEY,
-                    server_id INTEGER,
-                    channel_id INTEGER,
-                    fire_type TEXT,
-                    size_acres INTEGER,
-                    containment INTEGER,
-                    threat_level TEXT,
-                    status TEXT,
-                    created_at TEXT
-                )
-            ''')
-            
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS responders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fire_id TEXT,
-                    user_id INTEGER,
-                    user_name TEXT,
-                    role TEXT,
-                    assigned_at TEXT,
-                    FOREIGN KEY (fire_id) REFERENCES fires (id)
-                )
-            ''')
-            
-            await db.commit()
+        This method opens the connection shared by all game queries, switches the
+        database to WAL journaling and sets up the `fires` and `responders` tables
+        required for game operation. It should be called once when the game system starts.
+        """
+        self._db = await aiosqlite.connect(self.db_path)
+        db = self._db
+        # WAL lets readers proceed during writes; NORMAL sync only fsyncs on checkpoint.
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        # Wait on a locked database instead of failing, and checkpoint less often.
+        await db.execute("PRAGMA busy_timeout=5000")
+        await db.execute("PRAGMA wal_autocheckpoint=2000")
+        # Keep sort/temp B-trees off disk and give the page cache ~32 MB.
+        await db.execute("PRAGMA temp_store=MEMORY")
+        await db.execute("PRAGMA cache_size=-32000")
+
+        # Create the whole schema in one script and one transaction.
+        await db.executescript('''
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS fires (
+                id TEXT PRIMARY KEY,
+                server_id INTEGER,
+                channel_id INTEGER,
+                fire_type TEXT,
+                size_acres INTEGER,
+                containment INTEGER,
+                threat_level TEXT,
+                status TEXT,
+                created_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS responders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fire_id TEXT,
+                user_id INTEGER,
+                user_name TEXT,
+                role TEXT,
+                assigned_at TEXT,
+                FOREIGN KEY (fire_id) REFERENCES fires (id)
+            );
+            -- Indexes serving the active-fire listing and its per-fire responder counts.
+            CREATE INDEX IF NOT EXISTS idx_fires_server_status ON fires (server_id, status);
+            CREATE INDEX IF NOT EXISTS idx_responders_fire ON responders (fire_id);
+            COMMIT;
+        ''')
+        
+    async def close(self):
+        """
+        Closes the shared database connection opened by `init_database`.
+        """
+        if self._db is not None:
+            # Refresh planner statistics for the indexes before shutting down.
+            await self._db.execute("PRAGMA optimize")
+            await self._db.close()
+            self._db = None
             
     async def create_fire(self, server_id: int, channel_id: int) -> dict:
         """
@@ -112,16 +136,15 @@ class WildfireGame:
             "created_at": datetime.now().isoformat()
         }
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT INTO fires (id, server_id, channel_id, fire_type, 
-                                 size_acres, containment, threat_level, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (fire_id, server_id, channel_id, fire_type, 
-                  fire_data["size_acres"], 0, fire_data["threat_level"], 
-                  "active", fire_data["created_at"]))
-            await db.commit()
-            
+        await self._db.execute('''
+            INSERT INTO fires (id, server_id, channel_id, fire_type, 
+                             size_acres, containment, threat_level, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (fire_id, server_id, channel_id, fire_type, 
+              fire_data["size_acres"], 0, fire_data["threat_level"], 
+              "active", fire_data["created_at"]))
+        await self._db.commit()
+        
         return fire_data
         
     async def assign_responder(self, fire_id: str, user_id: int, user_name: str) -> bool:
@@ -141,13 +164,12 @@ class WildfireGame:
         :return: True if the assignment was attempted (database will handle uniqueness).
         :rtype: bool
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT OR IGNORE INTO responders (fire_id, user_id, user_name, role, assigned_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (fire_id, user_id, user_name, "firefighter", datetime.now().isoformat()))
-            await db.commit()
-            return True
+        await self._db.execute('''
+            INSERT OR IGNORE INTO responders (fire_id, user_id, user_name, role, assigned_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (fire_id, user_id, user_name, "firefighter", datetime.now().isoformat()))
+        await self._db.commit()
+        return True
             
     async def get_active_fires(self, server_id: int) -> list[dict]:
         """
@@ -163,43 +185,48 @@ class WildfireGame:
                  and includes its details and responder count.
         :rtype: list[dict]
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute('''
-                SELECT * FROM fires WHERE server_id = ? AND status = 'active'
-            ''', (server_id,)) as cursor:
-                fires = await cursor.fetchall()
-                
-            fire_list = []
-            for fire in fires:
-                async with db.execute('''
-                    SELECT COUNT(*) FROM responders WHERE fire_id = ?
-                ''', (fire[0],)) as cursor:
-                    responder_count = (await cursor.fetchone())[0]
-                    
+        db = self._db
+        fire_list = []
+        contained_fire_ids = []
+        
+        # One round trip: each active fire joined with its responder count.
+        async with db.execute('''
+            SELECT f.id, f.fire_type, f.size_acres, f.containment, f.threat_level,
+                   COUNT(r.id)
+            FROM fires f
+            LEFT JOIN responders r ON r.fire_id = f.id
+            WHERE f.server_id = ? AND f.status = 'active'
+            GROUP BY f.id
+            ORDER BY f.rowid
+        ''', (server_id,)) as cursor:
+            async for fire_id, fire_type, size_acres, current_db_containment, threat_level, responder_count in cursor:
                 # Simplified containment progression logic for database-tracked fires.
                 # This is distinct from the more complex simulation in fire_engine.py.
                 # Each responder contributes a fixed amount (e.g., 10%) to containment.
-                # The fire's original containment value is fire[5].
-                current_db_containment = fire[5]
+                # current_db_containment is the fire's stored containment value.
                 containment = min(current_db_containment + (responder_count * 10), 100)
-                
-                # If containment reaches 100%, update the fire's status in the database.
+            
+                # If containment reaches 100%, the fire's status is updated below.
                 if containment >= 100:
-                    await db.execute('''
-                        UPDATE fires SET status = 'contained' WHERE id = ?
-                    ''', (fire[0],))
-                    await db.commit()
-                    
+                    contained_fire_ids.append((fire_id,))
+                
                 fire_list.append({
-                    "id": fire[0],
-                    "type": fire[3],
-                    "size_acres": fire[4],
+                    "id": fire_id,
+                    "type": fire_type,
+                    "size_acres": size_acres,
                     "containment": containment,
-                    "threat_level": fire[6],
+                    "threat_level": threat_level,
                     "responder_count": responder_count
                 })
-                
-            return fire_list
+            
+        # Mark all newly contained fires in a single statement and transaction.
+        if contained_fire_ids:
+            await db.executemany('''
+                UPDATE fires SET status = 'contained' WHERE id = ?
+            ''', contained_fire_ids)
+            await db.commit()
+            
+        return fire_list
 
 
 class WildfireCommands(commands.Cog):
@@ -230,6 +257,14 @@ class WildfireCommands(commands.Cog):
         """
         await self.game.init_database()
         
+    async def cog_unload(self):
+        """
+        Asynchronous teardown that runs when the Cog is unloaded.
+
+        This method closes the game's shared database connection.
+        """
+        await self.game.close()
+        
     async def add_safe_reaction(self, message: discord.Message, emoji: str):
         """
         Safely adds a reaction to a message, handling potential rate limits.
@@ -252,7 +287,7 @@ class WildfireCommands(commands.Cog):
                 await asyncio.sleep(retry_after)
                 await self.add_safe_reaction(message, emoji)
             else:
-                logging.error(f"Reaction failed: {str(e)}")
+                logging.error("Reaction failed: %s", e)
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -267,7 +302,7 @@ class WildfireCommands(commands.Cog):
         
         # Debug command tree state
         commands_in_tree = [cmd.name for cmd in self.bot.tree.get_commands()]
-        logging.info(f"🔥 Commands in tree: {commands_in_tree}")
+        logging.info("🔥 Commands in tree: %s", commands_in_tree)
         
         # Sync commands to guilds
         try:
@@ -275,14 +310,14 @@ class WildfireCommands(commands.Cog):
             for guild in self.bot.guilds:
                 synced = await self.bot.tree.sync(guild=guild)
                 total_synced += len(synced)
-                logging.info(f"🔥 Synced {len(synced)} commands to guild {guild.name}")
+                logging.info("🔥 Synced %d commands to guild %s", len(synced), guild.name)
                 if synced:
-                    logging.info(f"🔥 Commands synced: {[cmd['name'] for cmd in synced]}")
-            logging.info(f"🔥 Total {total_synced} wildfire commands synced")
+                    logging.info("🔥 Commands synced: %s", [cmd['name'] for cmd in synced])
+            logging.info("🔥 Total %d wildfire commands synced", total_synced)
         except Exception as e:
-            logging.error(f"Failed to sync commands: {e}")
+            logging.error("Failed to sync commands: %s", e)
             
-        logging.info(f"🔥 Wildfire bot online in {len(self.bot.guilds)} servers")
+        logging.info("🔥 Wildfire bot online in %d servers", len(self.bot.guilds))
 
     # Commands moved to setup() function. Docstrings for those are in the setup() function below.
     # The original methods like `fire_command` here are commented out or removed in the actual
@@ -26,37 +26,58 @@ class WildfireGame:
     def __init__(self, db_path="wildfire_game.db"):
         self.db_path = db_path
         self.active_fires = {}
+        self._db = None  # Shared connection, opened by init_database()
         
     async def init_database(self):
-        """Initialize SQLite database for game state."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS fires (
-                    id TEXT PRIMARY KEY,
-                    server_id INTEGER,
-                    channel_id INTEGER,
-                    fire_type TEXT,
-                    size_acres INTEGER,
-                    containment INTEGER,
-                    threat_level TEXT,
-                    status TEXT,
-                    created_at TEXT
-                )
-            ''')
-            
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS responders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fire_id TEXT,
-                    user_id INTEGER,
-                    user_name TEXT,
-                    role TEXT,
-                    assigned_at TEXT,
-                    FOREIGN KEY (fire_id) REFERENCES fires (id)
-                )
-            ''')
-            
-            await db.commit()
+        """Open the shared connection and initialize SQLite database for game state."""
+        self._db = await aiosqlite.connect(self.db_path)
+        db = self._db
+        # WAL lets readers proceed during writes; NORMAL sync only fsyncs on checkpoint.
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        # Wait on a locked database instead of failing, and checkpoint less often.
+        await db.execute("PRAGMA busy_timeout=5000")
+        await db.execute("PRAGMA wal_autocheckpoint=2000")
+        # Keep sort/temp B-trees off disk and give the page cache ~32 MB.
+        await db.execute("PRAGMA temp_store=MEMORY")
+        await db.execute("PRAGMA cache_size=-32000")
+        
+        # Create the whole schema in one script and one transaction.
+        await db.executescript('''
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS fires (
+                id TEXT PRIMARY KEY,
+                server_id INTEGER,
+                channel_id INTEGER,
+                fire_type TEXT,
+                size_acres INTEGER,
+                containment INTEGER,
+                threat_level TEXT,
+                status TEXT,
+                created_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS responders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fire_id TEXT,
+                user_id INTEGER,
+                user_name TEXT,
+                role TEXT,
+                assigned_at TEXT,
+                FOREIGN KEY (fire_id) REFERENCES fires (id)
+            );
+            -- Indexes serving the active-fire listing and its per-fire responder counts.
+            CREATE INDEX IF NOT EXISTS idx_fires_server_status ON fires (server_id, status);
+            CREATE INDEX IF NOT EXISTS idx_responders_fire ON responders (fire_id);
+            COMMIT;
+        ''')
+        
+    async def close(self):
+        """Close the shared database connection."""
+        if self._db is not None:
+            # Refresh planner statistics for the indexes before shutting down.
+            await self._db.execute("PRAGMA optimize")
+            await self._db.close()
+            self._db = None
             
     async def create_fire(self, server_id, channel_id):
         """Create new fire incident."""
@@ -76,62 +97,66 @@ class WildfireGame:
             "created_at": datetime.now().isoformat()
         }
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT INTO fires (id, server_id, channel_id, fire_type, 
-                                 size_acres, containment, threat_level, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (fire_id, server_id, channel_id, fire_type, 
-                  fire_data["size_acres"], 0, fire_data["threat_level"], 
-                  "active", fire_data["created_at"]))
-            await db.commit()
-            
+        await self._db.execute('''
+            INSERT INTO fires (id, server_id, channel_id, fire_type, 
+                             size_acres, containment, threat_level, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (fire_id, server_id, channel_id, fire_type, 
+              fire_data["size_acres"], 0, fire_data["threat_level"], 
+              "active", fire_data["created_at"]))
+        await self._db.commit()
+        
         return fire_data
         
     async def assign_responder(self, fire_id, user_id, user_name):
         """Assign player to fire incident."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT OR IGNORE INTO responders (fire_id, user_id, user_name, role, assigned_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (fire_id, user_id, user_name, "firefighter", datetime.now().isoformat()))
-            await db.commit()
-            return True
+        await self._db.execute('''
+            INSERT OR IGNORE INTO responders (fire_id, user_id, user_name, role, assigned_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (fire_id, user_id, user_name, "firefighter", datetime.now().isoformat()))
+        await self._db.commit()
+        return True
             
     async def get_active_fires(self, server_id):
         """Get active fires for a server."""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute('''
-                SELECT * FROM fires WHERE server_id = ? AND status = 'active'
-            ''', (server_id,)) as cursor:
-                fires = await cursor.fetchall()
-                
-            fire_list = []
-            for fire in fires:
-                async with db.execute('''
-                    SELECT COUNT(*) FROM responders WHERE fire_id = ?
-                ''', (fire[0],)) as cursor:
-                    responder_count = (await cursor.fetchone())[0]
-                    
+        db = self._db
+        fire_list = []
+        contained_fire_ids = []
+        
+        # One round trip: each active fire joined with its responder count.
+        async with db.execute('''
+            SELECT f.id, f.fire_type, f.size_acres, f.containment, f.threat_level,
+                   COUNT(r.id)
+            FROM fires f
+            LEFT JOIN responders r ON r.fire_id = f.id
+            WHERE f.server_id = ? AND f.status = 'active'
+            GROUP BY f.id
+            ORDER BY f.rowid
+        ''', (server_id,)) as cursor:
+            async for fire_id, fire_type, size_acres, current_containment, threat_level, responder_count in cursor:
                 # Simple containment progression
-                containment = min(fire[5] + (responder_count * 10), 100)
-                
+                containment = min(current_containment + (responder_count * 10), 100)
+            
                 if containment >= 100:
-                    await db.execute('''
-                        UPDATE fires SET status = 'contained' WHERE id = ?
-                    ''', (fire[0],))
-                    await db.commit()
-                    
+                    contained_fire_ids.append((fire_id,))
+                
                 fire_list.append({
-                    "id": fire[0],
-                    "type": fire[3],
-                    "size_acres": fire[4],
+                    "id": fire_id,
+                    "type": fire_type,
+                    "size_acres": size_acres,
                     "containment": containment,
-                    "threat_level": fire[6],
+                    "threat_level": threat_level,
                     "responder_count": responder_count
                 })
-                
-            return fire_list
+            
+        # Mark all newly contained fires in a single statement and transaction.
+        if contained_fire_ids:
+            await db.executemany('''
+                UPDATE fires SET status = 'contained' WHERE id = ?
+            ''', contained_fire_ids)
+            await db.commit()
+            
+        return fire_list
 
 
 class WildfireCommands(commands.Cog):
@@ -149,6 +174,10 @@ class WildfireCommands(commands.Cog):
         """Initialize game database when cog loads."""
         await self.game.init_database()
 
+    async def cog_unload(self):
+        """Close the game database connection when cog unloads."""
+        await self.game.close()
+
     @commands.Cog.listener()
     async def on_ready(self):
         """Bot startup handler."""
@@ -156,7 +185,7 @@ class WildfireCommands(commands.Cog):
         
         # Debug command tree state
         commands_in_tree = [cmd.name for cmd in self.bot.tree.get_commands()]
-        logging.info(f"🔥 Commands in tree: {commands_in_tree}")
+        logging.info("🔥 Commands in tree: %s", commands_in_tree)
         
         # Copy global commands to each guild then sync
         try:
@@ -168,14 +197,14 @@ class WildfireCommands(commands.Cog):
                 # Now sync guild-specific commands (includes copied globals)
                 synced = await self.bot.tree.sync(guild=guild)
                 total_synced += len(synced)
-                logging.info(f"🔥 Synced {len(synced)} commands to guild {guild.name}")
+                logging.info("🔥 Synced %d commands to guild %s", len(synced), guild.name)
                 if synced:
-                    logging.info(f"🔥 Commands synced: {[cmd['name'] for cmd in synced]}")
-            logging.info(f"🔥 Total {total_synced} wildfire commands synced")
+                    logging.info("🔥 Commands synced: %s", [cmd['name'] for cmd in synced])
+            logging.info("🔥 Total %d wildfire commands synced", total_synced)
         except Exception as e:
-            logging.error(f"Failed to sync commands: {e}")
+            logging.error("Failed to sync commands: %s", e)
             
-        logging.info(f"🔥 Wildfire bot online in {len(self.bot.guilds)} servers")
+        logging.info("🔥 Wildfire bot online in %d servers", len(self.bot.guilds))
 
 
 async def setup(bot):
@@ -10,6 +10,7 @@ import random
 import time
 from datetime import datetime, timedelta
 import json
+import logging
 import os
 from fire_engine import FireGrid, WeatherConditions
 from incident_reports import IncidentReportGenerator
@@ -17,6 +18,14 @@ from ui.hud_components import HUDComponents, HUDColors, HUDEmojis
 import asyncio
 from config.settings import config
 
+# Typed tactical choices accepted in DMs: message text -> (resource type, display name).
+TYPED_TACTICAL_CHOICES = {
+    "1": ("hand_crews", "Ground Crews"), "1️⃣": ("hand_crews", "Ground Crews"),
+    "2": ("air_tankers", "Air Support"), "2️⃣": ("air_tankers", "Air Support"),
+    "3": ("engines", "Engine Company"), "3️⃣": ("engines", "Engine Company"),
+    "4": ("dozers", "Dozer"), "4️⃣": ("dozers", "Dozer"),
+}
+
 
 class TeamTacticalChoicesView(discord.ui.View):
     """Interactive button choices for team tactical decisions."""
@@ -162,7 +171,7 @@ class TeamTacticalChoicesView(discord.ui.View):
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 
         except Exception as e:
-            print(f"Error in team choice handling: {e}")
+            logging.error("Error in team choice handling: %s", e)
             embed = HUDComponents.create_error_embed(
                 "SYSTEM ERROR",
                 "Error processing team deployment - please try again"
@@ -410,7 +419,7 @@ class TacticalChoicesView(discord.ui.View):
                 else:
                     await interaction.response.send_message(embed=embed)
         except Exception as e:
-            print(f"Error in _handle_choice_result: {e}")
+            logging.error("Error in _handle_choice_result: %s", e)
             # Show basic tactical update even on error
             user_state = self.singleplayer_game.get_user_state(self.user_id)
             stats = user_state["fire_grid"].get_fire_statistics() if user_state.get("fire_grid") else {}
@@ -1020,13 +1029,13 @@ class WildfireCommands(commands.Cog):
         if admin_ids_str:
             self.admin_user_ids = [int(uid.strip()) for uid in admin_ids_str.split(',') if uid.strip().isdigit()]
             if not self.admin_user_ids: # Handles case where string might be non-empty but contain no valid IDs
-                print("WARNING: ADMIN_USER_IDS was set but contained no valid numeric UIDs. Debug commands will not be usable.")
+                logging.warning("ADMIN_USER_IDS was set but contained no valid numeric UIDs. Debug commands will not be usable.")
                 self.admin_user_ids = [] # Ensure it's an empty list
             else:
-                print(f"Admin User IDs loaded: {self.admin_user_ids}")
+                logging.info("Admin User IDs loaded: %s", self.admin_user_ids)
         else:
             self.admin_user_ids = []
-            print("WARNING: No ADMIN_USER_IDS configured. Debug commands will not be usable by anyone.")
+            logging.warning("No ADMIN_USER_IDS configured. Debug commands will not be usable by anyone.")
 
     async def is_admin_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id not in self.admin_user_ids:
@@ -1041,12 +1050,12 @@ class WildfireCommands(commands.Cog):
         
         # Debug command tree state
         commands_in_tree = [cmd.name for cmd in self.bot.tree.get_commands()]
-        print(f"🔥 Commands in tree: {commands_in_tree}")
+        logging.info("🔥 Commands in tree: %s", commands_in_tree)
         
         # Sync commands globally first for DM usage
         try:
             global_synced = await self.bot.tree.sync()
-            print(f"🔥 Synced {len(global_synced)} commands globally")
+            logging.info("🔥 Synced %d commands globally", len(global_synced))
             
             # Copy global commands to each guild then sync
             total_synced = 0
@@ -1057,13 +1066,13 @@ class WildfireCommands(commands.Cog):
                 # Now sync guild-specific commands (includes copied globals)
                 synced = await self.bot.tree.sync(guild=guild)
                 total_synced += len(synced)
-                print(f"🔥 Synced {len(synced)} commands to guild {guild.name}")
+                logging.info("🔥 Synced %d commands to guild %s", len(synced), guild.name)
                 
-            print(f"🔥 Total {total_synced} guild commands synced")
+            logging.info("🔥 Total %d guild commands synced", total_synced)
         except Exception as e:
-            print(f"Failed to sync commands: {e}")
+            logging.error("Failed to sync commands: %s", e)
             
-        print(f"🔥 Wildfire bot online in {len(self.bot.guilds)} servers")
+        logging.info("🔥 Wildfire bot online in %d servers", len(self.bot.guilds))
         
         # Start auto-progression background task
         if not self.auto_progression_task or self.auto_progression_task.done():
@@ -1083,7 +1092,7 @@ class WildfireCommands(commands.Cog):
             )
         else:
             # Log other errors
-            print(f"Unhandled app command error: {error}") # Or use proper logging
+            logging.error("Unhandled app command error: %s", error)
             # Optionally send a generic error message
             # await interaction.response.send_message("An unexpected error occurred.", ephemeral=True)
             pass # Or re-raise, or handle more specifically
@@ -1095,24 +1104,19 @@ class WildfireCommands(commands.Cog):
         if message.author.bot or message.guild is not None:
             return
             
+        # Anything other than a numbered choice is ignored before touching game state
+        choice = TYPED_TACTICAL_CHOICES.get(message.content.strip())
+        if choice is None:
+            return
+            
         # Check if user has active incident
         user_state = self.singleplayer_game.get_user_state(message.author.id)
         if user_state["game_phase"] != "active":
             return
             
-        # Handle numbered choices
-        if message.content.strip() in ["1", "1️⃣"]:
-            result = self.singleplayer_game.deploy_resources(message.author.id, "hand_crews", 1)
-            await self._send_choice_response(message.channel, "Ground Crews", result, message.author.id)
-        elif message.content.strip() in ["2", "2️⃣"]:
-            result = self.singleplayer_game.deploy_resources(message.author.id, "air_tankers", 1)
-            await self._send_choice_response(message.channel, "Air Support", result, message.author.id)
-        elif message.content.strip() in ["3", "3️⃣"]:
-            result = self.singleplayer_game.deploy_resources(message.author.id, "engines", 1)
-            await self._send_choice_response(message.channel, "Engine Company", result, message.author.id)
-        elif message.content.strip() in ["4", "4️⃣"]:
-            result = self.singleplayer_game.deploy_resources(message.author.id, "dozers", 1)
-            await self._send_choice_response(message.channel, "Dozer", result, message.author.id)
+        resource_type, resource_name = choice
+        result = self.singleplayer_game.deploy_resources(message.author.id, resource_type, 1)
+        await self._send_choice_response(message.channel, resource_name, result, message.author.id)
     
     async def _send_choice_response(self, channel, resource_name, result, user_id):
         """Send response for typed tactical choice."""
@@ -1281,7 +1285,7 @@ class WildfireCommands(commands.Cog):
             await interaction.followup.send(message)
             
         except Exception as e:
-            print(f"Error in multiplayer fire creation: {e}")
+            logging.error("Error in multiplayer fire creation: %s", e)
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ Error creating fire incident", ephemeral=True)
@@ -1426,7 +1430,7 @@ class WildfireCommands(commands.Cog):
             await interaction.followup.send(message, view=view)
             
         except Exception as e:
-            print(f"Error in multiplayer respond: {e}")
+            logging.error("Error in multiplayer respond: %s", e)
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ Error joining incident", ephemeral=True)
@@ -2168,9 +2172,9 @@ Use `/stop` to see your performance report."""
         try:
             await channel.send(update_message)
         except discord.Forbidden:
-            print(f"Cannot send update to channel {fire_data['channel_id']} - permissions issue")
+            logging.warning("Cannot send update to channel %s - permissions issue", fire_data['channel_id'])
         except Exception as e:
-            print(f"Error sending guild fire update: {e}")
+            logging.error("Error sending guild fire update: %s", e)
     
     async def _auto_progression_loop(self):
         """Background task that automatically progresses fires and sends updates."""
@@ -2212,7 +2216,7 @@ Use `/stop` to see your performance report."""
                                 pass
                                 
                         except Exception as e:
-                            print(f"Error in auto-progression for user {user_id}: {e}")
+                            logging.error("Error in auto-progression for user %s: %s", user_id, e)
                 
                 # Process guild fires
                 for fire_id, fire_data in list(self.game.active_fires.items()):
@@ -2235,10 +2239,10 @@ Use `/stop` to see your performance report."""
                             await self._send_guild_fire_update(fire_id, auto_result)
                                 
                         except Exception as e:
-                            print(f"Error in guild fire auto-progression for {fire_id}: {e}")
+                            logging.error("Error in guild fire auto-progression for %s: %s", fire_id, e)
                             
             except Exception as e:
-                print(f"Error in auto-progression loop: {e}")
+                logging.error("Error in auto-progression loop: %s", e)
                 await asyncio.sleep(30)  # Wait longer on error
 
 
@@ -2248,4 +2252,4 @@ async def setup_wildfire_commands(bot):
     @details Context-aware commands for both DM and Guild modes
     """
     await bot.add_cog(WildfireCommands(bot))
-    print("🔥 Wildfire commands cog loaded - syncing will happen on ready")
\ No newline at end of file
+    logging.info("🔥 Wildfire commands cog loaded - syncing will happen on ready")
\ No newline at end of file
@@ -4,40 +4,108 @@
 @details Implements realistic fire spread, terrain effects, and weather conditions
 """
 
+import os
 import random
 import time
-from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from enum import IntEnum
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import json
 
 
-class TerrainType(Enum):
+class TerrainType(IntEnum):
     """Terrain types affecting fire behavior."""
-    FOREST = "forest"
-    GRASS = "grass" 
-    URBAN = "urban"
-    RIDGE = "ridge"
-    VALLEY = "valley"
+    FOREST = 0
+    GRASS = 1
+    URBAN = 2
+    RIDGE = 3
+    VALLEY = 4
 
 
-class FireState(Enum):
-    """Fire states for cellular automata."""
-    EMPTY = "empty"
-    BURNING = "burning"
-    BURNED = "burned"
-    CONTAINED = "contained"
+class FireState(IntEnum):
+    """Fire states for cellular automata (integer valued for cheap comparisons)."""
+    EMPTY = 0
+    BURNING = 1
+    BURNED = 2
+    CONTAINED = 3
+
+
+# Offsets (dx, dy) of the eight cells surrounding a grid cell.
+NEIGHBOR_OFFSETS = tuple(
+    (dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy
+)
+
+WIND_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+FORECAST_RELIABILITY_LEVELS = ("high", "moderate", "low")
+
+# Unit vector (dx, dy) each wind direction blows towards on the grid.
+WIND_DIRECTION_VECTORS = {
+    "N": (0, -1), "NE": (1, -1), "E": (1, 0), "SE": (1, 1),
+    "S": (0, 1), "SW": (-1, 1), "W": (-1, 0), "NW": (-1, -1)
+}
+
+# Spread multipliers based on the target cell's terrain type.
+TERRAIN_SPREAD_MULTIPLIERS = {
+    TerrainType.GRASS: 1.5,   # Fast spread due to fine fuels.
+    TerrainType.FOREST: 1.0,  # Normal spread rate.
+    TerrainType.URBAN: 0.8,   # Slower initial spread, but implies high value and potential for intense burning.
+    TerrainType.RIDGE: 1.2,   # Fire tends to spread faster uphill.
+    TerrainType.VALLEY: 0.7   # Valleys can act as barriers or channel wind, here simplified to slower.
+}
+
+# Probability distribution used when generating terrain for a new grid.
+TERRAIN_WEIGHTS = {
+    TerrainType.FOREST: 0.4,
+    TerrainType.GRASS: 0.3,
+    TerrainType.URBAN: 0.1,
+    TerrainType.RIDGE: 0.1,
+    TerrainType.VALLEY: 0.1
+}
+
+# Inclusive (min, max) fuel load range for each terrain type.
+FUEL_LOAD_RANGES = {
+    TerrainType.GRASS: (1, 3),
+    TerrainType.FOREST: (4, 8),
+    TerrainType.URBAN: (6, 10),
+    TerrainType.RIDGE: (2, 5),
+    TerrainType.VALLEY: (3, 6)
+}
+
+# Containment probability multipliers based on the burning cell's terrain type.
+TERRAIN_SUPPRESSION_MULTIPLIERS = {
+    TerrainType.FOREST: 1.0,
+    TerrainType.GRASS: 1.0,
+    TerrainType.URBAN: 0.6,   # Urban environments can be complex and challenging for suppression.
+    TerrainType.RIDGE: 0.8,   # Ridges can be difficult to access and work on.
+    TerrainType.VALLEY: 1.3   # Valleys might offer better access or tactical advantages.
+}
+
+# Spread steps a burning cell survives per unit of fuel load before burning out.
+BURNOUT_TICKS_PER_FUEL = 2
+
+BASE_SPREAD_PROBABILITY = 0.3
+MAX_SPREAD_PROBABILITY = 0.9
+FUEL_LOAD_NORMALIZER = 5.0
 
 
 class WeatherConditions:
     """Weather conditions affecting fire behavior."""
     
-    def __init__(self):
-        self.wind_direction = random.choice(["N", "NE", "E", "SE", "S", "SW", "W", "NW"])
-        self.wind_speed = random.randint(5, 25)  # mph
-        self.temperature = random.randint(75, 105)  # fahrenheit
-        self.humidity = random.randint(10, 60)  # percent
-        self.forecast_reliability = random.choice(["high", "moderate", "low"])
+    def __init__(self, rng: Optional[random.Random] = None):
+        rng = rng or random
+        self.wind_direction = rng.choice(WIND_DIRECTIONS)
+        self.wind_speed = rng.randint(5, 25)  # mph
+        self.temperature = rng.randint(75, 105)  # fahrenheit
+        self.humidity = rng.randint(10, 60)  # percent
+        self.forecast_reliability = rng.choice(FORECAST_RELIABILITY_LEVELS)
+        
+        # Derived spread factors, cached so the fire engine reads plain attributes.
+        self.wind_vector = WIND_DIRECTION_VECTORS[self.wind_direction]
+        self.wind_boost = 1.0 + self.wind_speed / 25.0  # Max speed 25mph.
+        self.temp_factor = self.temperature / 100.0
+        self.humid_factor = 1.0 - self.humidity / 100.0
         
     def get_fire_danger_rating(self):
         """Calculate fire danger based on weather conditions."""
@@ -81,32 +149,32 @@ class WeatherConditions:
 class FireCell:
     """Individual cell in the fire grid."""
     
-    def __init__(self, terrain: TerrainType, x: int, y: int):
+    # A grid holds size * size cells; slots keep each one free of a per-instance __dict__.
+    __slots__ = (
+        "terrain", "fire_state", "ignition_tick", "contained_tick",
+        "x", "y", "fuel_load", "burn_intensity"
+    )
+    
+    def __init__(self, terrain: TerrainType, x: int, y: int, rng: Optional[random.Random] = None):
         self.terrain = terrain
         self.fire_state = FireState.EMPTY
-        self.ignition_time = None
-        self.contained_time = None
+        self.ignition_tick = None
+        self.contained_tick = None
         self.x = x
         self.y = y
-        self.fuel_load = self._calculate_fuel_load()
+        self.fuel_load = self._calculate_fuel_load(rng or random)
         self.burn_intensity = 0
         
-    def _calculate_fuel_load(self):
+    def _calculate_fuel_load(self, rng):
         """Calculate fuel load based on terrain type."""
-        fuel_loads = {
-            TerrainType.GRASS: random.randint(1, 3),
-            TerrainType.FOREST: random.randint(4, 8), 
-            TerrainType.URBAN: random.randint(6, 10),
-            TerrainType.RIDGE: random.randint(2, 5),
-            TerrainType.VALLEY: random.randint(3, 6)
-        }
-        return fuel_loads.get(self.terrain, 3)
+        fuel_range = FUEL_LOAD_RANGES.get(self.terrain)
+        return rng.randint(*fuel_range) if fuel_range else 3
         
-    def ignite(self):
-        """Set cell on fire."""
+    def ignite(self, tick: int = 0):
+        """Set cell on fire at the given simulation tick."""
         if self.fire_state == FireState.EMPTY:
             self.fire_state = FireState.BURNING
-            self.ignition_time = datetime.now()
+            self.ignition_tick = tick
             self.burn_intensity = self.fuel_load
             
     def burn_out(self):
@@ -115,11 +183,11 @@ class FireCell:
             self.fire_state = FireState.BURNED
             self.burn_intensity = 0
             
-    def contain(self):
-        """Fire contained by suppression efforts."""
+    def contain(self, tick: int = 0):
+        """Fire contained by suppression efforts at the given simulation tick."""
         if self.fire_state == FireState.BURNING:
             self.fire_state = FireState.CONTAINED
-            self.contained_time = datetime.now()
+            self.contained_tick = tick
             self.burn_intensity = 0
 
 
@@ -129,19 +197,26 @@ class FireGrid:
     @details Internal grid simulation - never displayed visually per design principles
     """
     
-    def __init__(self, size: int = 8):
+    def __init__(self, size: int = 8, seed: Optional[int] = None):
         """
         Initializes the FireGrid.
 
         :param size: The dimension of the square grid (e.g., 8 for an 8x8 grid).
         :type size: int
+        :param seed: Optional seed for the grid's random number generator, making
+                     terrain generation, spread and suppression rolls reproducible.
+        :type seed: Optional[int]
         """
         self.size = size
+        self._rng = random.Random(seed)
         self.grid: List[List[FireCell]] = []
-        self.weather = WeatherConditions()
+        self.weather = WeatherConditions(self._rng)
         self.operational_period = 1
+        self.current_tick = 0  # Number of spread steps simulated so far.
         self.incident_start_time = datetime.now()
         self.total_acres = size * size * 10  # Each cell represents 10 acres.
+        self._spread_lut = {}
+        self._spread_lut_weather = None
         self._initialize_grid()
         
     def _initialize_grid(self):
@@ -149,35 +224,25 @@ class FireGrid:
         Initializes the grid with FireCell objects, assigning terrain types
         based on predefined weights.
         """
-        # terrain_weights define the probability distribution for different terrain types.
+        # TERRAIN_WEIGHTS define the probability distribution for different terrain types.
         # For example, FOREST has a 40% chance, GRASS 30%, etc.
-        # These weights are used to create a list from which random.choice picks.
-        terrain_weights = {
-            TerrainType.FOREST: 0.4,
-            TerrainType.GRASS: 0.3,
-            TerrainType.URBAN: 0.1, 
-            TerrainType.RIDGE: 0.1,
-            TerrainType.VALLEY: 0.1
-        }
-        
-        terrain_choices = []
-        for terrain, weight in terrain_weights.items():
-            terrain_choices.extend([terrain] * int(weight * 100))
+        # All cells are drawn in a single weighted random.choices call.
+        terrains = self._rng.choices(
+            tuple(TERRAIN_WEIGHTS), weights=tuple(TERRAIN_WEIGHTS.values()), k=self.size * self.size
+        )
             
         for y in range(self.size):
-            row = []
-            for x in range(self.size):
-                terrain = random.choice(terrain_choices)
-                cell = FireCell(terrain, x, y)
-                row.append(cell)
-            self.grid.append(row)
+            row_terrains = terrains[y * self.size:(y + 1) * self.size]
+            self.grid.append([
+                FireCell(terrain, x, y, self._rng) for x, terrain in enumerate(row_terrains)
+            ])
     
     def start_fire(self, intensity: str = "moderate"):
         """Start initial fire at random location."""
-        start_x = random.randint(1, self.size - 2)
-        start_y = random.randint(1, self.size - 2)
+        start_x = self._rng.randint(1, self.size - 2)
+        start_y = self._rng.randint(1, self.size - 2)
         
-        self.grid[start_y][start_x].ignite()
+        self.grid[start_y][start_x].ignite(self.current_tick)
         
         # Start additional cells based on intensity
         if intensity == "high":
@@ -188,13 +253,18 @@ class FireGrid:
             additional_cells = 2
             
         for _ in range(additional_cells):
-            adj_x = start_x + random.choice([-1, 0, 1])
-            adj_y = start_y + random.choice([-1, 0, 1])
+            adj_x = start_x + self._rng.choice((-1, 0, 1))
+            adj_y = start_y + self._rng.choice((-1, 0, 1))
             if 0 <= adj_x < self.size and 0 <= adj_y < self.size:
-                self.grid[adj_y][adj_x].ignite()
+                self.grid[adj_y][adj_x].ignite(self.current_tick)
     
     def spread_fire(self):
         """Spread fire to adjacent cells based on conditions."""
+        self.current_tick += 1
+        if self._spread_lut_weather is not self.weather:
+            self._build_spread_lut()
+        spread_lut = self._spread_lut
+        rand = self._rng.random
         new_fires = []
         
         for y in range(self.size):
@@ -203,29 +273,59 @@ class FireGrid:
                 
                 if cell.fire_state == FireState.BURNING:
                     # Check adjacent cells for spread
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue
-                                
-                            new_x, new_y = x + dx, y + dy
-                            if 0 <= new_x < self.size and 0 <= new_y < self.size:
-                                adjacent_cell = self.grid[new_y][new_x]
-                                
-                                if adjacent_cell.fire_state == FireState.EMPTY:
-                                    spread_prob = self._calculate_spread_probability(
-                                        cell, adjacent_cell, dx, dy
-                                    )
-                                    if random.random() < spread_prob:
-                                        new_fires.append((new_x, new_y))
+                    for dx, dy in NEIGHBOR_OFFSETS:
+                        new_x, new_y = x + dx, y + dy
+                        if 0 <= new_x < self.size and 0 <= new_y < self.size:
+                            adjacent_cell = self.grid[new_y][new_x]
+                            
+                            if adjacent_cell.fire_state == FireState.EMPTY:
+                                spread_prob = min(
+                                    spread_lut[adjacent_cell.terrain, dx, dy] * adjacent_cell.fuel_load,
+                                    MAX_SPREAD_PROBABILITY
+                                )
+                                if rand() < spread_prob:
+                                    new_fires.append((new_x, new_y))
         
         # Apply new fires
         for x, y in new_fires:
-            self.grid[y][x].ignite()
+            self.grid[y][x].ignite(self.current_tick)
             
         # Age existing fires
         self._age_fires()
     
+    def _build_spread_lut(self):
+        """
+        Precomputes spread probabilities for the current weather conditions.
+
+        Terrain, wind, temperature and humidity effects only depend on the target
+        cell's terrain and the spread direction while the weather stays the same,
+        so they are folded into a table keyed by ``(terrain, dx, dy)`` holding the
+        probability per unit of target fuel load. The table is rebuilt whenever
+        ``self.weather`` is replaced, i.e. once per operational period.
+        """
+        weather = self.weather
+        wind_dx, wind_dy = weather.wind_vector
+        
+        # Temperature and humidity effects: Higher temperature and lower humidity favor fire spread.
+        weather_factor = (
+            BASE_SPREAD_PROBABILITY * weather.temp_factor * weather.humid_factor / FUEL_LOAD_NORMALIZER
+        )
+        
+        spread_lut = {}
+        for terrain, terrain_multiplier in TERRAIN_SPREAD_MULTIPLIERS.items():
+            for dx, dy in NEIGHBOR_OFFSETS:
+                # Wind effects: Spread is more likely if aligned with wind direction, less likely against it.
+                if dx == wind_dx and dy == wind_dy:
+                    wind_multiplier = weather.wind_boost
+                elif dx == -wind_dx and dy == -wind_dy:
+                    wind_multiplier = 0.5
+                else:
+                    wind_multiplier = 1.0
+                spread_lut[terrain, dx, dy] = weather_factor * terrain_multiplier * wind_multiplier
+        
+        self._spread_lut = spread_lut
+        self._spread_lut_weather = weather
+    
     def _calculate_spread_probability(self, source: FireCell, target: FireCell, 
                                     dx: int, dy: int) -> float:
         """
@@ -238,7 +338,8 @@ class FireGrid:
         - Target fuel load: Higher fuel load in the target cell increases probability.
         - Temperature: Higher temperatures increase probability.
         - Humidity: Lower humidity increases probability.
-        The final probability is a combination of these factors and is capped.
+        All factors except the fuel load come from the precomputed spread table
+        (see ``_build_spread_lut``). The final probability is capped.
 
         :param source: The FireCell object that is currently burning.
         :type source: FireCell
@@ -251,62 +352,29 @@ class FireGrid:
         :return: The calculated spread probability (0.0 to 0.9).
         :rtype: float
         """
-        base_prob = 0.3  # Initial base probability for spread.
-        
-        # Terrain effects: Multipliers based on the target cell's terrain type.
-        # Grass burns easily, Urban areas might be more resistant initially or channel fire differently.
-        terrain_multipliers = {
-            TerrainType.GRASS: 1.5,  # Fast spread due to fine fuels.
-            TerrainType.FOREST: 1.0,  # Normal spread rate.
-            TerrainType.URBAN: 0.8,   # Slower initial spread, but implies high value and potential for intense burning.
-            TerrainType.RIDGE: 1.2,   # Fire tends to spread faster uphill.
-            TerrainType.VALLEY: 0.7   # Valleys can act as barriers or channel wind, here simplified to slower.
-        }
-        prob = base_prob * terrain_multipliers.get(target.terrain, 1.0)
-        
-        # Wind effects: Wind direction and speed significantly impact spread.
-        # Spread is more likely if aligned with wind direction, less likely against it.
-        wind_directions = {
-            "N": (0, -1), "NE": (1, -1), "E": (1, 0), "SE": (1, 1),
-            "S": (0, 1), "SW": (-1, 1), "W": (-1, 0), "NW": (-1, -1)
-        }
-        wind_dx, wind_dy = wind_directions[self.weather.wind_direction]
-        
-        if dx == wind_dx and dy == wind_dy:  # Spreading in the same direction as the wind.
-            prob *= (1 + self.weather.wind_speed / 25.0)  # Increase prob based on wind speed (max speed 25mph).
-        elif dx == -wind_dx and dy == -wind_dy:  # Spreading directly against the wind.
-            prob *= 0.5  # Significantly reduce probability.
-            
-        # Fuel load effect: Higher fuel load in the target cell means more material to burn.
-        # Normalized by a factor (e.g., 5.0) to scale its impact.
-        prob *= (target.fuel_load / 5.0)
-        
-        # Temperature and humidity effects: Higher temperature and lower humidity favor fire spread.
-        # Normalized by 100 to represent them as factors.
-        prob *= (self.weather.temperature / 100.0)  # Higher temp increases prob.
-        prob *= (1.0 - self.weather.humidity / 100.0)  # Lower humidity increases prob.
+        if self._spread_lut_weather is not self.weather:
+            self._build_spread_lut()
+        prob = self._spread_lut[target.terrain, dx, dy] * target.fuel_load
         
         # Final probability is capped to prevent certainty and keep some randomness.
-        return min(prob, 0.9)
+        return min(prob, MAX_SPREAD_PROBABILITY)
     
     def _age_fires(self):
         """
-        Ages existing fires. If a fire has been burning for a duration determined
-        by its fuel_load, it transitions to the BURNED state (natural burnout).
+        Ages existing fires. If a fire has been burning for a number of spread
+        steps determined by its fuel_load, it transitions to the BURNED state
+        (natural burnout).
         """
-        for y in range(self.size):
-            for x in range(self.size):
-                cell = self.grid[y][x]
-                
-                if cell.fire_state == FireState.BURNING and cell.ignition_time:
-                    burn_time = datetime.now() - cell.ignition_time
-                    
-                    # Natural burnout condition:
-                    # Burnout time is proportional to fuel_load.
-                    # Here, each unit of fuel_load is assumed to burn for approx. 2 hours.
-                    burnout_hours = cell.fuel_load * 2
-                    if burn_time.total_seconds() / 3600 > burnout_hours:
-                        cell.burn_out()
+        current_tick = self.current_tick
+        burning = FireState.BURNING
+        
+        for row in self.grid:
+            for cell in row:
+                # Natural burnout condition:
+                # Burnout time is proportional to fuel_load, measured in simulation ticks.
+                if (cell.fire_state == burning
+                        and current_tick - cell.ignition_tick > cell.fuel_load * BURNOUT_TICKS_PER_FUEL):
+                    cell.burn_out()
     
     def apply_suppression(self, suppression_points: int):
         """
@@ -319,12 +387,10 @@ class FireGrid:
         :param suppression_points: Total suppression points available for this turn.
         :type suppression_points: int
         """
-        burning_cells = []
-        for y in range(self.size):
-            for x in range(self.size):
-                cell = self.grid[y][x]
-                if cell.fire_state == FireState.BURNING:
-                    burning_cells.append(cell)
+        burning_cells = [
+            cell for row in self.grid for cell in row
+            if cell.fire_state == FireState.BURNING
+        ]
         
         if not burning_cells:
             return # No active fires to suppress.
@@ -333,22 +399,15 @@ class FireGrid:
         # Each burning cell gets at least 1 point if points are available.
         points_per_cell = max(1, suppression_points // len(burning_cells))
         
+        # Base containment probability increases with more points allocated to the cell.
+        # Capped at 0.8 to ensure containment isn't guaranteed solely by points.
+        # Terrain difficulty then scales it per cell.
+        contain_prob = min(0.8, points_per_cell * 0.1)
+        rand = self._rng.random
+        
         for cell in burning_cells:
-            # Base containment probability increases with more points allocated to the cell.
-            # Capped at 0.8 to ensure containment isn't guaranteed solely by points.
-            contain_prob = min(0.8, points_per_cell * 0.1)
-            
-            # Terrain difficulty factors modify containment probability.
-            # Some terrains are harder to operate in or have more resilient structures.
-            if cell.terrain == TerrainType.URBAN:
-                contain_prob *= 0.6  # Urban environments can be complex and challenging for suppression.
-            elif cell.terrain == TerrainType.VALLEY:
-                contain_prob *= 1.3  # Valleys might offer better access or tactical advantages.
-            elif cell.terrain == TerrainType.RIDGE:
-                contain_prob *= 0.8  # Ridges can be difficult to access and work on.
-                
-            if random.random() < contain_prob:
-                cell.contain() # Cell is successfully contained.
+            if rand() < contain_prob * TERRAIN_SUPPRESSION_MULTIPLIERS[cell.terrain]:
+                cell.contain(self.current_tick) # Cell is successfully contained.
     
     def get_fire_statistics(self) -> Dict:
         """
@@ -401,7 +460,7 @@ class FireGrid:
         self.operational_period += 1
         
         # Update weather conditions
-        self.weather = WeatherConditions()
+        self.weather = WeatherConditions(self._rng)
         
         # Spread fire multiple times to simulate time passage
         for _ in range(3):
@@ -409,11 +468,8 @@ class FireGrid:
     
     def is_contained(self) -> bool:
         """Check if fire is fully contained."""
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.grid[y][x].fire_state == FireState.BURNING:
-                    return False
-        return True
+        burning = FireState.BURNING
+        return not any(cell.fire_state == burning for row in self.grid for cell in row)
     
     def get_threat_assessment(self) -> Dict:
         """Assess threats to structures and values at risk."""
@@ -459,4 +515,50 @@ class FireGrid:
             "total_structures": urban_cells * 25,  # Assume 25 structures per urban cell
             "threatened_structures": threatened_urban * 25,
             "evacuation_recommended": threatened_urban > 0
-        }
\ No newline at end of file
+        }
+
+
+def _run_simulation(seed: int, size: int, periods: int) -> Dict:
+    """
+    Runs one seeded, unattended simulation and returns its final statistics.
+
+    Module-level so it can be pickled into worker processes by `simulate_batch`.
+    """
+    fire_grid = FireGrid(size, seed=seed)
+    fire_grid.start_fire()
+    for _ in range(periods):
+        if fire_grid.is_contained():
+            break
+        fire_grid.advance_operational_period()
+    return fire_grid.get_fire_statistics()
+
+
+def simulate_batch(n_runs: int, periods: int = 3, seed: int = 0, size: int = 8,
+                   max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Runs many independent fire simulations in parallel worker processes.
+
+    Intended for Monte Carlo style analysis such as tuning spread parameters
+    or game balance. Run ``i`` uses grid seed ``seed + i``.
+
+    :param n_runs: Number of independent simulations to run.
+    :type n_runs: int
+    :param periods: Operational periods to advance each simulation.
+    :type periods: int
+    :param seed: Seed of the first run.
+    :type seed: int
+    :param size: Grid dimension for every run.
+    :type size: int
+    :param max_workers: Worker process count, defaults to the CPU count.
+    :type max_workers: Optional[int]
+    :return: Final `get_fire_statistics()` result of each run, in seed order.
+    :rtype: List[Dict]
+    """
+    workers = max_workers or os.cpu_count() or 1
+    # Hand out seeds in chunks so IPC overhead stays small relative to the work.
+    chunksize = max(1, n_runs // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            _run_simulation, range(seed, seed + n_runs), repeat(size), repeat(periods),
+            chunksize=chunksize
+        ))
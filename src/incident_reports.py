@@ -10,61 +10,32 @@ from typing import Dict, List
 from fire_engine import FireGrid, TerrainType
 
 
-class IncidentReportGenerator:
-    """
-    @brief Generate professional wildfire incident reports
-    @details Converts internal simulation to authentic ICS terminology and format
-    """
-    
-    def __init__(self):
-        self.incident_names = [
-            "Wildcat Fire", "Ridge Runner Fire", "Smokey Hills Fire", 
-            "Grassland Fire", "Valley View Fire", "Pine Creek Fire",
-            "Sunset Mesa Fire", "Canyon Wind Fire", "Cedar Grove Fire"
-        ]
-        self.location_descriptors = [
-            "steep terrain with limited access roads",
-            "mixed fuel types including grass and timber",
-            "interface area with residential structures",
-            "remote wilderness with helicopter access only", 
-            "agricultural area with seasonal crop residue",
-            "heavy timber with significant fire loading"
-        ]
-        
-    def generate_incident_name(self) -> str:
-        """Generate realistic fire incident name."""
-        return random.choice(self.incident_names)
-    
-    def generate_initial_dispatch_report(self, fire_grid: FireGrid, incident_name: str) -> str:
-        """Generate initial dispatch report for fire discovery."""
-        stats = fire_grid.get_fire_statistics()
-        threats = fire_grid.get_threat_assessment()
-        location_desc = random.choice(self.location_descriptors)
-        
-        report = f"""🚨 **INITIAL DISPATCH REPORT - {incident_name.upper()}**
+# Report skeletons are built once at import; each report call only fills in
+# the placeholders via str.format_map.
+_DISPATCH_TEMPLATE = """🚨 **INITIAL DISPATCH REPORT - {name_upper}**
 
 **INCIDENT INFORMATION**
 • **Incident Name:** {incident_name}
-• **Incident Number:** {datetime.now().strftime('%Y')}-{random.randint(1000, 9999)}
-• **Report Time:** {datetime.now().strftime('%H%M hours, %d %b %Y')}
-• **Incident Commander:** IC-{random.randint(100, 999)}
+• **Incident Number:** {year}-{incident_number}
+• **Report Time:** {report_time}
+• **Incident Commander:** IC-{commander_id}
 
 **FIRE SITUATION**
-• **Current Size:** {stats['fire_size_acres']} acres
-• **Rate of Spread:** {'Rapid' if stats['active_cells'] > 3 else 'Moderate' if stats['active_cells'] > 1 else 'Slow'}
-• **Fire Behavior:** {'Extreme' if stats['weather']['fire_danger'] == 'EXTREME' else 'Active' if stats['weather']['fire_danger'] in ['HIGH', 'MODERATE'] else 'Minimal'}
-• **Containment:** {stats['containment_percent']}%
+• **Current Size:** {fire_size_acres} acres
+• **Rate of Spread:** {rate_of_spread}
+• **Fire Behavior:** {fire_behavior}
+• **Containment:** {containment_percent}%
 
 **WEATHER CONDITIONS**
-• **Wind:** {stats['weather']['wind_direction']} at {stats['weather']['wind_speed']} mph
-• **Temperature:** {stats['weather']['temperature']}°F
-• **Relative Humidity:** {stats['weather']['humidity']}%
-• **Fire Weather Rating:** {stats['weather']['fire_danger']}
+• **Wind:** {wind_direction} at {wind_speed} mph
+• **Temperature:** {temperature}°F
+• **Relative Humidity:** {humidity}%
+• **Fire Weather Rating:** {fire_danger}
 
 **THREAT ASSESSMENT**
-• **Structures Threatened:** {threats['threatened_structures']}
-• **Threat Level:** {threats['threat_level']}
-• **Evacuation Status:** {'RECOMMENDED' if threats['evacuation_recommended'] else 'NONE REQUIRED'}
+• **Structures Threatened:** {threatened_structures}
+• **Threat Level:** {threat_level}
+• **Evacuation Status:** {evacuation_status}
 
 **LOCATION & ACCESS**
 • **General Location:** Fire occurring in {location_desc}
@@ -86,57 +57,39 @@ class IncidentReportGenerator:
 ---
 *Incident Command System • Educational Wildfire Simulation*"""
 
-        return report
-    
-    def generate_operational_briefing(self, fire_grid: FireGrid, incident_name: str) -> str:
-        """Generate operational period briefing."""
-        stats = fire_grid.get_fire_statistics()
-        threats = fire_grid.get_threat_assessment()
-        
-        # Determine fire behavior trend
-        if stats['active_cells'] > 5:
-            behavior_trend = "INCREASING"
-            behavior_desc = "Fire activity remains high with potential for continued growth"
-        elif stats['active_cells'] > 2:
-            behavior_trend = "MODERATE"
-            behavior_desc = "Fire showing moderate activity with opportunities for containment"
-        else:
-            behavior_trend = "DECREASING"
-            behavior_desc = "Fire activity decreasing, good progress on containment"
-        
-        report = f"""📋 **OPERATIONAL BRIEFING - {incident_name.upper()}**
+_BRIEFING_TEMPLATE = """📋 **OPERATIONAL BRIEFING - {name_upper}**
 
-**OPERATIONAL PERIOD {stats['operational_period']} BRIEFING**
-• **Time:** {datetime.now().strftime('%H%M hours, %d %b %Y')}
-• **Incident Duration:** {stats['incident_duration']}
+**OPERATIONAL PERIOD {operational_period} BRIEFING**
+• **Time:** {report_time}
+• **Incident Duration:** {incident_duration}
 • **Briefing Officer:** Plans Section Chief
 
 **CURRENT SITUATION**
-• **Fire Size:** {stats['fire_size_acres']} acres
-• **Containment:** {stats['containment_percent']}%
+• **Fire Size:** {fire_size_acres} acres
+• **Containment:** {containment_percent}%
 • **Fire Behavior:** {behavior_trend} - {behavior_desc}
-• **Active Perimeter:** {stats['active_cells']} active sectors
+• **Active Perimeter:** {active_cells} active sectors
 
 **WEATHER FORECAST**
-• **Current Conditions:** {stats['weather']['wind_direction']} winds {stats['weather']['wind_speed']} mph
-• **Temperature:** {stats['weather']['temperature']}°F, RH {stats['weather']['humidity']}%
-• **Fire Weather:** {stats['weather']['fire_danger']} danger rating
-• **Forecast Reliability:** {'High confidence' if random.random() > 0.3 else 'Moderate confidence'}
+• **Current Conditions:** {wind_direction} winds {wind_speed} mph
+• **Temperature:** {temperature}°F, RH {humidity}%
+• **Fire Weather:** {fire_danger} danger rating
+• **Forecast Reliability:** {forecast_reliability}
 
 **CRITICAL INFORMATION**
-• **Structure Threat:** {threats['threatened_structures']} structures at risk
-• **Threat Level:** {threats['threat_level']}
-• **Public Safety:** {'Evacuation in effect' if threats['evacuation_recommended'] else 'No evacuations required'}
+• **Structure Threat:** {threatened_structures} structures at risk
+• **Threat Level:** {threat_level}
+• **Public Safety:** {public_safety}
 
 **TACTICAL PRIORITIES**
-1. **Primary:** {'Structure protection and public safety' if threats['threat_level'] in ['HIGH', 'EXTREME'] else 'Establish containment lines'}
-2. **Secondary:** {'Containment on flanks' if stats['containment_percent'] < 50 else 'Mop-up and patrol'}
-3. **Tertiary:** {'Prepare for extended operations' if stats['fire_size_acres'] > 100 else 'Resource demobilization planning'}
+1. **Primary:** {primary_priority}
+2. **Secondary:** {secondary_priority}
+3. **Tertiary:** {tertiary_priority}
 
 **SUPPRESSION STRATEGY**
-• **Direct Attack:** {'Not recommended' if stats['weather']['fire_danger'] == 'EXTREME' else 'Opportunities available'}
-• **Indirect Attack:** {'Primary strategy' if stats['fire_size_acres'] > 50 else 'Secondary option'}
-• **Tactical Approach:** {'Defensive' if threats['threat_level'] in ['HIGH', 'EXTREME'] else 'Offensive'}
+• **Direct Attack:** {direct_attack}
+• **Indirect Attack:** {indirect_attack}
+• **Tactical Approach:** {tactical_approach}
 
 **SAFETY CONSIDERATIONS**
 • **Weather Impact:** Wind conditions affecting suppression operations
@@ -146,34 +99,28 @@ class IncidentReportGenerator:
 
 **NEXT OPERATIONAL PERIOD**
 • **Duration:** 12 hours
-• **Objectives:** {'Focus on structure protection' if threats['threat_level'] in ['HIGH', 'EXTREME'] else 'Continue containment efforts'}
+• **Objectives:** {next_objectives}
 • **Resource Needs:** Additional assessment pending
 
 ---
 *End of Briefing - Questions to Plans Section*"""
 
-        return report
-    
-    def generate_resource_status_report(self, resources_deployed: Dict) -> str:
-        """Generate resource status and effectiveness report."""
-        total_personnel = sum(resources_deployed.values())
-        
-        report = f"""👥 **RESOURCE STATUS REPORT**
+_RESOURCE_STATUS_TEMPLATE = """👥 **RESOURCE STATUS REPORT**
 
 **CURRENT DEPLOYMENT**
 • **Total Personnel:** {total_personnel} firefighters assigned
-• **Ground Resources:** {resources_deployed.get('hand_crews', 0)} hand crews
-• **Engines:** {resources_deployed.get('engines', 0)} engine companies
-• **Air Resources:** {resources_deployed.get('air_tankers', 0)} aircraft available
+• **Ground Resources:** {hand_crews} hand crews
+• **Engines:** {engines} engine companies
+• **Air Resources:** {air_tankers} aircraft available
 
 **RESOURCE EFFECTIVENESS**
-• **Suppression Progress:** {'Excellent' if total_personnel > 60 else 'Good' if total_personnel > 30 else 'Limited'} progress with current resources
-• **Resource Utilization:** {'Optimal' if total_personnel > 40 else 'Adequate' if total_personnel > 20 else 'Insufficient'}
+• **Suppression Progress:** {suppression_progress} progress with current resources
+• **Resource Utilization:** {resource_utilization}
 • **Tactical Success:** Based on deployment and fire conditions
 
 **RESOURCE REQUESTS**
-• **Additional Needs:** {'No additional resources required' if total_personnel > 50 else 'Additional ground resources recommended'}
-• **Air Support:** {'Effective when weather permits' if resources_deployed.get('air_tankers', 0) > 0 else 'Request air resources'}
+• **Additional Needs:** {additional_needs}
+• **Air Support:** {air_support}
 
 **OPERATIONAL NOTES**
 • All resources operating within established safety protocols
@@ -183,93 +130,47 @@ class IncidentReportGenerator:
 ---
 *Resource Unit • Incident Command Post*"""
 
-        return report
-    
-    def generate_situation_update(self, fire_grid: FireGrid, incident_name: str, 
-                                special_note: str = None) -> str:
-        """Generate situation update report for significant changes."""
-        stats = fire_grid.get_fire_statistics()
-        threats = fire_grid.get_threat_assessment()
-        
-        # Determine update priority
-        if threats['threat_level'] in ['HIGH', 'EXTREME']:
-            priority = "URGENT"
-        elif stats['containment_percent'] > 75:
-            priority = "ROUTINE"
-        else:
-            priority = "NORMAL"
-        
-        report = f"""📢 **SITUATION UPDATE - {priority}**
+_SITUATION_UPDATE_TEMPLATE = """📢 **SITUATION UPDATE - {priority}**
 
-**{incident_name.upper()} - {datetime.now().strftime('%H%M HRS')}**
+**{name_upper} - {header_time}**
 
 **FIRE STATUS CHANGE**
-• **Size:** {stats['fire_size_acres']} acres ({'+' if random.random() > 0.3 else '='}{random.randint(0, 20)} acres since last report)
-• **Containment:** {stats['containment_percent']}% contained
-• **Active Burning:** {stats['active_cells']} active sectors
-
-**SIGNIFICANT DEVELOPMENTS**"""
+• **Size:** {fire_size_acres} acres ({size_trend}{size_change} acres since last report)
+• **Containment:** {containment_percent}% contained
+• **Active Burning:** {active_cells} active sectors
 
-        if special_note:
-            report += f"\n• {special_note}"
-        
-        if threats['evacuation_recommended']:
-            report += "\n• **EVACUATION ADVISORY:** Residents advised to prepare for evacuation"
-        
-        if stats['weather']['fire_danger'] == 'EXTREME':
-            report += "\n• **WEATHER ALERT:** Extreme fire weather conditions"
-        
-        if stats['containment_percent'] > 50:
-            report += "\n• **CONTAINMENT PROGRESS:** Significant progress on fire perimeter"
-        
-        report += f"""
+**SIGNIFICANT DEVELOPMENTS**{developments}
 
 **IMMEDIATE ACTIONS**
-• Continue {'structure protection' if threats['threat_level'] in ['HIGH', 'EXTREME'] else 'suppression operations'}
-• {'Prepare for possible evacuation' if threats['evacuation_recommended'] else 'Monitor fire progression'}
+• Continue {continue_action}
+• {evacuation_action}
 • Maintain communication with incident command
 
-**NEXT UPDATE:** {'In 1 hour' if priority == 'URGENT' else 'Next operational period'} or significant change
+**NEXT UPDATE:** {next_update} or significant change
 
 ---
-*Information Officer • {datetime.now().strftime('%H%M hrs')}*"""
+*Information Officer • {footer_time}*"""
 
-        return report
-    
-    def generate_after_action_report(self, fire_grid: FireGrid, incident_name: str,
-                                   final_stats: Dict) -> str:
-        """Generate after-action report for completed incident."""
-        lessons = [
-            "Early detection and rapid initial attack proved effective",
-            "Coordination between ground and air resources was essential",
-            "Weather monitoring provided critical tactical advantage",
-            "Structure protection priorities were properly established",
-            "Resource deployment timing impacted suppression success",
-            "Communication systems performed well under operational stress"
-        ]
-        
-        selected_lessons = random.sample(lessons, 3)
-        
-        report = f"""📊 **AFTER ACTION REPORT - {incident_name.upper()}**
+_AFTER_ACTION_TEMPLATE = """📊 **AFTER ACTION REPORT - {name_upper}**
 
 **INCIDENT SUMMARY**
-• **Final Size:** {final_stats['fire_size_acres']} acres
-• **Containment:** {final_stats['containment_percent']}% at control
-• **Duration:** {final_stats['incident_duration']}
-• **Operational Periods:** {final_stats['operational_period']}
+• **Final Size:** {fire_size_acres} acres
+• **Containment:** {containment_percent}% at control
+• **Duration:** {incident_duration}
+• **Operational Periods:** {operational_period}
 
 **INCIDENT OUTCOMES**
-• **Structures:** {final_stats['threatened_structures']} structures threatened, {'significant protection achieved' if final_stats['containment_percent'] > 70 else 'mixed protection results'}
-• **Suppression Success:** {'Highly effective' if final_stats['containment_percent'] > 80 else 'Effective' if final_stats['containment_percent'] > 50 else 'Challenging conditions'}
+• **Structures:** {threatened_structures} structures threatened, {protection_result}
+• **Suppression Success:** {suppression_success}
 • **Resource Efficiency:** Multiple resources deployed effectively
 
 **LESSONS LEARNED**
-1. {selected_lessons[0]}
-2. {selected_lessons[1]}
-3. {selected_lessons[2]}
+1. {lesson_1}
+2. {lesson_2}
+3. {lesson_3}
 
 **TACTICAL PERFORMANCE**
-• **Decision Making:** {'Excellent' if final_stats['containment_percent'] > 75 else 'Good' if final_stats['containment_percent'] > 50 else 'Room for improvement'} tactical decisions under pressure
+• **Decision Making:** {decision_making} tactical decisions under pressure
 • **Resource Management:** Effective allocation of available resources
 • **Safety Record:** All operations conducted within safety protocols
 
@@ -288,4 +189,202 @@ class IncidentReportGenerator:
 *This concludes the {incident_name} simulation*
 *Incident Command System Educational Experience*"""
 
-        return report
\ No newline at end of file
+
+class IncidentReportGenerator:
+    """
+    @brief Generate professional wildfire incident reports
+    @details Converts internal simulation to authentic ICS terminology and format
+    """
+
+    INCIDENT_NAMES = (
+        "Wildcat Fire", "Ridge Runner Fire", "Smokey Hills Fire",
+        "Grassland Fire", "Valley View Fire", "Pine Creek Fire",
+        "Sunset Mesa Fire", "Canyon Wind Fire", "Cedar Grove Fire"
+    )
+    LOCATION_DESCRIPTORS = (
+        "steep terrain with limited access roads",
+        "mixed fuel types including grass and timber",
+        "interface area with residential structures",
+        "remote wilderness with helicopter access only",
+        "agricultural area with seasonal crop residue",
+        "heavy timber with significant fire loading"
+    )
+    LESSONS = (
+        "Early detection and rapid initial attack proved effective",
+        "Coordination between ground and air resources was essential",
+        "Weather monitoring provided critical tactical advantage",
+        "Structure protection priorities were properly established",
+        "Resource deployment timing impacted suppression success",
+        "Communication systems performed well under operational stress"
+    )
+
+    def generate_incident_name(self) -> str:
+        """Generate realistic fire incident name."""
+        return random.choice(self.INCIDENT_NAMES)
+
+    def generate_initial_dispatch_report(self, fire_grid: FireGrid, incident_name: str) -> str:
+        """Generate initial dispatch report for fire discovery."""
+        stats = fire_grid.get_fire_statistics()
+        threats = fire_grid.get_threat_assessment()
+        weather = stats['weather']
+        active_cells = stats['active_cells']
+        fire_danger = weather['fire_danger']
+        location_desc = random.choice(self.LOCATION_DESCRIPTORS)
+        now = datetime.now()
+
+        return _DISPATCH_TEMPLATE.format_map({
+            "name_upper": incident_name.upper(),
+            "incident_name": incident_name,
+            "year": now.year,
+            "incident_number": random.randint(1000, 9999),
+            "report_time": now.strftime('%H%M hours, %d %b %Y'),
+            "commander_id": random.randint(100, 999),
+            "fire_size_acres": stats['fire_size_acres'],
+            "rate_of_spread": 'Rapid' if active_cells > 3 else 'Moderate' if active_cells > 1 else 'Slow',
+            "fire_behavior": 'Extreme' if fire_danger == 'EXTREME' else 'Active' if fire_danger in ('HIGH', 'MODERATE') else 'Minimal',
+            "containment_percent": stats['containment_percent'],
+            "wind_direction": weather['wind_direction'],
+            "wind_speed": weather['wind_speed'],
+            "temperature": weather['temperature'],
+            "humidity": weather['humidity'],
+            "fire_danger": weather['fire_danger'],
+            "threatened_structures": threats['threatened_structures'],
+            "threat_level": threats['threat_level'],
+            "evacuation_status": 'RECOMMENDED' if threats['evacuation_recommended'] else 'NONE REQUIRED',
+            "location_desc": location_desc,
+        })
+
+    def generate_operational_briefing(self, fire_grid: FireGrid, incident_name: str) -> str:
+        """Generate operational period briefing."""
+        stats = fire_grid.get_fire_statistics()
+        threats = fire_grid.get_threat_assessment()
+        weather = stats['weather']
+        active_cells = stats['active_cells']
+        fire_size_acres = stats['fire_size_acres']
+        containment_percent = stats['containment_percent']
+        fire_danger = weather['fire_danger']
+        threat_level = threats['threat_level']
+        high_threat = threat_level in ('HIGH', 'EXTREME')
+
+        # Determine fire behavior trend
+        if active_cells > 5:
+            behavior_trend = "INCREASING"
+            behavior_desc = "Fire activity remains high with potential for continued growth"
+        elif active_cells > 2:
+            behavior_trend = "MODERATE"
+            behavior_desc = "Fire showing moderate activity with opportunities for containment"
+        else:
+            behavior_trend = "DECREASING"
+            behavior_desc = "Fire activity decreasing, good progress on containment"
+
+        return _BRIEFING_TEMPLATE.format_map({
+            "name_upper": incident_name.upper(),
+            "operational_period": stats['operational_period'],
+            "report_time": datetime.now().strftime('%H%M hours, %d %b %Y'),
+            "incident_duration": stats['incident_duration'],
+            "fire_size_acres": fire_size_acres,
+            "containment_percent": containment_percent,
+            "behavior_trend": behavior_trend,
+            "behavior_desc": behavior_desc,
+            "active_cells": active_cells,
+            "wind_direction": weather['wind_direction'],
+            "wind_speed": weather['wind_speed'],
+            "temperature": weather['temperature'],
+            "humidity": weather['humidity'],
+            "fire_danger": fire_danger,
+            "forecast_reliability": 'High confidence' if random.random() > 0.3 else 'Moderate confidence',
+            "threatened_structures": threats['threatened_structures'],
+            "threat_level": threat_level,
+            "public_safety": 'Evacuation in effect' if threats['evacuation_recommended'] else 'No evacuations required',
+            "primary_priority": 'Structure protection and public safety' if high_threat else 'Establish containment lines',
+            "secondary_priority": 'Containment on flanks' if containment_percent < 50 else 'Mop-up and patrol',
+            "tertiary_priority": 'Prepare for extended operations' if fire_size_acres > 100 else 'Resource demobilization planning',
+            "direct_attack": 'Not recommended' if fire_danger == 'EXTREME' else 'Opportunities available',
+            "indirect_attack": 'Primary strategy' if fire_size_acres > 50 else 'Secondary option',
+            "tactical_approach": 'Defensive' if high_threat else 'Offensive',
+            "next_objectives": 'Focus on structure protection' if high_threat else 'Continue containment efforts',
+        })
+
+    def generate_resource_status_report(self, resources_deployed: Dict) -> str:
+        """Generate resource status and effectiveness report."""
+        total_personnel = sum(resources_deployed.values())
+
+        return _RESOURCE_STATUS_TEMPLATE.format_map({
+            "total_personnel": total_personnel,
+            "hand_crews": resources_deployed.get('hand_crews', 0),
+            "engines": resources_deployed.get('engines', 0),
+            "air_tankers": resources_deployed.get('air_tankers', 0),
+            "suppression_progress": 'Excellent' if total_personnel > 60 else 'Good' if total_personnel > 30 else 'Limited',
+            "resource_utilization": 'Optimal' if total_personnel > 40 else 'Adequate' if total_personnel > 20 else 'Insufficient',
+            "additional_needs": 'No additional resources required' if total_personnel > 50 else 'Additional ground resources recommended',
+            "air_support": 'Effective when weather permits' if resources_deployed.get('air_tankers', 0) > 0 else 'Request air resources',
+        })
+
+    def generate_situation_update(self, fire_grid: FireGrid, incident_name: str,
+                                special_note: str = None) -> str:
+        """Generate situation update report for significant changes."""
+        stats = fire_grid.get_fire_statistics()
+        threats = fire_grid.get_threat_assessment()
+        containment_percent = stats['containment_percent']
+        high_threat = threats['threat_level'] in ('HIGH', 'EXTREME')
+        evacuation_recommended = threats['evacuation_recommended']
+        now = datetime.now()
+
+        # Determine update priority
+        if high_threat:
+            priority = "URGENT"
+        elif containment_percent > 75:
+            priority = "ROUTINE"
+        else:
+            priority = "NORMAL"
+
+        developments = []
+        if special_note:
+            developments.append(f"• {special_note}")
+
+        if evacuation_recommended:
+            developments.append("• **EVACUATION ADVISORY:** Residents advised to prepare for evacuation")
+
+        if stats['weather']['fire_danger'] == 'EXTREME':
+            developments.append("• **WEATHER ALERT:** Extreme fire weather conditions")
+
+        if containment_percent > 50:
+            developments.append("• **CONTAINMENT PROGRESS:** Significant progress on fire perimeter")
+
+        return _SITUATION_UPDATE_TEMPLATE.format_map({
+            "priority": priority,
+            "name_upper": incident_name.upper(),
+            "header_time": now.strftime('%H%M HRS'),
+            "fire_size_acres": stats['fire_size_acres'],
+            "size_trend": '+' if random.random() > 0.3 else '=',
+            "size_change": random.randint(0, 20),
+            "containment_percent": containment_percent,
+            "active_cells": stats['active_cells'],
+            "developments": "".join("\n" + line for line in developments),
+            "continue_action": 'structure protection' if high_threat else 'suppression operations',
+            "evacuation_action": 'Prepare for possible evacuation' if evacuation_recommended else 'Monitor fire progression',
+            "next_update": 'In 1 hour' if priority == 'URGENT' else 'Next operational period',
+            "footer_time": now.strftime('%H%M hrs'),
+        })
+
+    def generate_after_action_report(self, fire_grid: FireGrid, incident_name: str,
+                                   final_stats: Dict) -> str:
+        """Generate after-action report for completed incident."""
+        containment_percent = final_stats['containment_percent']
+        selected_lessons = random.sample(self.LESSONS, 3)
+
+        return _AFTER_ACTION_TEMPLATE.format_map({
+            "name_upper": incident_name.upper(),
+            "incident_name": incident_name,
+            "fire_size_acres": final_stats['fire_size_acres'],
+            "containment_percent": containment_percent,
+            "incident_duration": final_stats['incident_duration'],
+            "operational_period": final_stats['operational_period'],
+            "threatened_structures": final_stats['threatened_structures'],
+            "protection_result": 'significant protection achieved' if containment_percent > 70 else 'mixed protection results',
+            "suppression_success": 'Highly effective' if containment_percent > 80 else 'Effective' if containment_percent > 50 else 'Challenging conditions',
+            "lesson_1": selected_lessons[0],
+            "lesson_2": selected_lessons[1],
+            "lesson_3": selected_lessons[2],
+            "decision_making": 'Excellent' if containment_percent > 75 else 'Good' if containment_percent > 50 else 'Room for improvement',
+        })
@@ -39,9 +39,10 @@ async def start_health_server():
     app.router.add_get('/health', health_check)
     app.router.add_get('/', health_check)
     
-    runner = web.AppRunner(app)
+    # No access log for the probe endpoint; idle keep-alive sockets close after 75 s.
+    runner = web.AppRunner(app, access_log=None, keepalive_timeout=75)
     await runner.setup()
-    site = web.TCPSite(runner, '0.0.0.0', 8080)
+    site = web.TCPSite(runner, '0.0.0.0', 8080, backlog=512, shutdown_timeout=5)
     await site.start()
     logging.info("Health check server started on port 8080")
 